@@ -157,20 +157,15 @@ def courses(race_id: int) -> None:
             raise typer.Abort
 
         for course in race.courses:
+            event_categories = [assignment.category.event_category for assignment in course.categories]
             typer.echo(f"{course.name}: ", nl=False)
             typer.echo(
-                sum(
-                    (len(assignment.category.event_category.entry_requests) for assignment in course.categories),
-                    0,
-                ),
+                sum(len(category.entry_requests) for category in event_categories),
                 nl=False,
             )
             typer.echo(
                 " = "
-                + " + ".join(
-                    f"{len(cat.entry_requests)}·{cat.short_name}"
-                    for cat in (assignment.category.event_category for assignment in course.categories)
-                ),
+                + " + ".join(f"{len(category.entry_requests)}·{category.short_name}" for category in event_categories),
             )
 
         courses_by_first_control = core.group_courses_by_first_control(race)
@@ -3,6 +3,8 @@
 import logging
 from contextlib import suppress
 from itertools import groupby
+from operator import itemgetter
+from typing import Any
 
 from sqlalchemy import create_engine, orm, select
 from sqlalchemy.exc import NoResultFound
@@ -13,7 +15,17 @@ _logger = logging.getLogger(__name__)
 
 
 def open_session(source: str) -> orm.Session:
-    engine = create_engine(source, echo=False)
+    engine_options: dict[str, Any] = {
+        "echo": False,
+        # The default compiled-statement cache (500) is too small for the
+        # number of distinct ORM statements an import plus start list export
+        # produces.
+        "query_cache_size": 1200,
+        # Batch size for RETURNING-enabled multi-row inserts; matches the
+        # magnitude of the Base.bulk_insert batches.
+        "insertmanyvalues_page_size": 1000,
+    }
+    engine = create_engine(source, **engine_options)
     if source.startswith("sqlite:"):
         tools.fix_sqlite_engine(engine)
     model.Base.metadata.create_all(engine)
@@ -25,7 +37,15 @@ def open_session(source: str) -> orm.Session:
 def get_event(session: orm.Session, event_id: int) -> model.Event | None:
     with suppress(NoResultFound):
         return session.scalars(
-            select(model.Event).where(model.Event.event_id == event_id),
+            select(model.Event)
+            .where(model.Event.event_id == event_id)
+            # Callers iterate these collections right away, so load each of
+            # them with a single IN query instead of one lazy SELECT per row.
+            .options(
+                orm.selectinload(model.Event.races),
+                orm.selectinload(model.Event.event_categories),
+                orm.selectinload(model.Event.entries),
+            ),
         ).one()
     return None
 
@@ -33,7 +53,14 @@ def get_event(session: orm.Session, event_id: int) -> model.Event | None:
 def get_race(session: orm.Session, race_id: int) -> model.Race | None:
     with suppress(NoResultFound):
         return session.scalars(
-            select(model.Race).where(model.Race.race_id == race_id),
+            select(model.Race)
+            .where(model.Race.race_id == race_id)
+            .options(
+                orm.selectinload(model.Race.categories).selectinload(model.Category.event_category),
+                orm.selectinload(model.Race.courses)
+                .selectinload(model.Course.controls)
+                .selectinload(model.CourseControl.control),
+            ),
         ).one()
     return None
 
@@ -43,10 +70,13 @@ def get_countries(session: orm.Session) -> list[model.Country]:
 
 
 def group_courses_by_first_control(race: model.Race) -> dict[str, list[model.Course]]:
-    def get_first_control(course: model.Course) -> str:
-        return course.controls[1].control.label
-
+    # Resolve the first control only once per course; it is a relationship
+    # chain and would otherwise be re-evaluated for every comparison.
+    keyed_courses = sorted(
+        ((course.controls[1].control.label, course) for course in race.courses),
+        key=itemgetter(0),
+    )
     return {
-        control_label: list(course_group)
-        for control_label, course_group in groupby(sorted(race.courses, key=get_first_control), get_first_control)
+        control_label: [course for _, course in course_group]
+        for control_label, course_group in groupby(keyed_courses, itemgetter(0))
     }
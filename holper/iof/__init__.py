@@ -7,17 +7,24 @@ pydantic-xml does not support forward refs with `from __future__ import annotati
 Cf. https://github.com/international-orienteering-federation/datastandard-v3/blob/master/IOF.xsd
 """
 
-from .class_list import ClassList
-from .competitor_list import CompetitorList
-from .control_card_list import ControlCardList
-from .course_data import CourseData
-from .entry_list import EntryList
-from .event_list import EventList
-from .importer import Importer
-from .organisation_list import OrganisationList
-from .result_list import ResultList
-from .service_request_list import ServiceRequestList
-from .start_list import StartList
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # At runtime these names resolve lazily through __getattr__ below; ruff
+    # takes their __all__ entries for runtime use and wants the imports moved
+    # out of the type-checking block, which would defeat the lazy loading.
+    from .class_list import ClassList  # noqa: TCH004
+    from .competitor_list import CompetitorList  # noqa: TCH004
+    from .control_card_list import ControlCardList  # noqa: TCH004
+    from .course_data import CourseData  # noqa: TCH004
+    from .entry_list import EntryList  # noqa: TCH004
+    from .event_list import EventList  # noqa: TCH004
+    from .importer import Importer  # noqa: TCH004
+    from .organisation_list import OrganisationList  # noqa: TCH004
+    from .result_list import ResultList  # noqa: TCH004
+    from .service_request_list import ServiceRequestList  # noqa: TCH004
+    from .start_list import StartList  # noqa: TCH004
 
 __all__ = [
     "ClassList",
@@ -32,3 +39,28 @@ __all__ = [
     "ServiceRequestList",
     "StartList",
 ]
+
+# Building the pydantic-xml model classes is expensive, so the message modules
+# are only imported when their root model is first accessed.
+_MODULE_BY_EXPORT = {
+    "ClassList": "class_list",
+    "CompetitorList": "competitor_list",
+    "ControlCardList": "control_card_list",
+    "CourseData": "course_data",
+    "EntryList": "entry_list",
+    "EventList": "event_list",
+    "Importer": "importer",
+    "OrganisationList": "organisation_list",
+    "ResultList": "result_list",
+    "ServiceRequestList": "service_request_list",
+    "StartList": "start_list",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _MODULE_BY_EXPORT:
+        return getattr(import_module("." + _MODULE_BY_EXPORT[name], __name__), name)
+    if name in _MODULE_BY_EXPORT.values():
+        return import_module("." + name, __name__)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
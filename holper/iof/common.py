@@ -1,7 +1,8 @@
 import datetime
 from decimal import Decimal
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal, Self
 
+from lxml import etree
 from pydantic import constr
 from pydantic_xml import BaseXmlModel, attr, element
 from typing_extensions import Doc
@@ -11,10 +12,36 @@ nsmap = {
     "xsi": "http://www.w3.org/2001/XMLSchema-instance",
 }
 
+# IOF XML files use neither DTDs nor entities, so skip entity resolution and
+# network access when parsing. This is both faster and keeps entity-expansion
+# attacks out of imported files.
+_xml_parser = etree.XMLParser(
+    resolve_entities=False,
+    no_network=True,
+    remove_comments=True,
+    remove_pis=True,
+    collect_ids=False,
+)
+
 
 class IOFBaseModel(BaseXmlModel, nsmap=nsmap, search_mode="ordered"):
     """Config for all pydantic-xml model classes."""
 
+    @classmethod
+    def from_xml(
+        cls,
+        source: str | bytes,
+        context: dict[str, Any] | None = None,
+        empty_as_string: bool = False,  # noqa: FBT001, FBT002 - signature is fixed by the supertype
+        **kwargs: Any,  # noqa: ANN401 - signature is fixed by the supertype
+    ) -> Self:
+        return cls.from_xml_tree(
+            # lxml-stubs types the parse result as _Element while pydantic-xml is annotated with the Element factory.
+            etree.fromstring(source, parser=_xml_parser, **kwargs),  # type: ignore [arg-type] # noqa: S320 - the parser disables entity resolution and network access
+            context=context,
+            empty_as_string=empty_as_string,
+        )
+
 
 class BaseMessageElement(IOFBaseModel):
     """The base message element that all message elements extend."""
@@ -187,6 +214,20 @@ class Image(IOFBaseModel):
     resolution: Annotated[float | None, attr(name="resolution"), Doc("The resolution of the image in dpi.")] = None
 
 
+# The hierarchical level or type of an organisation.
+OrganisationType = Literal[
+    "IOF",
+    "IOFRegion",
+    "NationalFederation",
+    "NationalRegion",
+    "Club",
+    "School",
+    "Company",
+    "Military",
+    "Other",
+]
+
+
 class Organisation(IOFBaseModel):
     """Information about an organisation, i.e. address, contact person(s) etc. An organisation is a general term including federations, clubs, etc."""
 
@@ -229,18 +270,7 @@ class Organisation(IOFBaseModel):
         ),
     ] = []
     type: Annotated[
-        Literal[
-            "IOF",
-            "IOFRegion",
-            "NationalFederation",
-            "NationalRegion",
-            "Club",
-            "School",
-            "Company",
-            "Military",
-            "Other",
-        ]
-        | None,
+        OrganisationType | None,
         attr(name="type"),
         Doc("The hierarchical level or type of an organisation."),
     ] = None
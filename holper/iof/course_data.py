@@ -270,7 +270,7 @@ class RaceCourseData(IOFBaseModel):
         )
 
     def delete_unused_courses(self) -> None:
-        used_courses = [assignment.course_name for assignment in self.all_course_assignments]
+        used_courses = {assignment.course_name for assignment in self.all_course_assignments}
         self.courses = [course for course in self.courses if course.name in used_courses]
 
 
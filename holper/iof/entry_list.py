@@ -18,6 +18,15 @@ from .common import (
     ServiceRequest,
 )
 
+# The type of start time allocation request.
+StartTimeAllocationRequestType = Literal[
+    "Normal",
+    "EarlyStart",
+    "LateStart",
+    "SeparatedFrom",
+    "GroupedWith",
+]
+
 
 class StartTimeAllocationRequest(IOFBaseModel):
     """Used to state start time allocation requests. It consists of a possible reference Organisation or Person and the allocation request, e.g. late start or grouped with the reference Organisation/Person. This way it is possible to state requests to the event organizer so that e.g. all members of an organisation has start times close to each other - or parents have start times far from each other. It is totally up to the event software and organizers whether they will support such requests."""
@@ -33,13 +42,7 @@ class StartTimeAllocationRequest(IOFBaseModel):
         Doc("The reference person for the start time allocation request."),
     ] = None
     type: Annotated[
-        Literal[
-            "Normal",
-            "EarlyStart",
-            "LateStart",
-            "SeparatedFrom",
-            "GroupedWith",
-        ],
+        StartTimeAllocationRequestType,
         attr(name="type"),
         Doc(
             """The type of start time allocation request.
@@ -1,15 +1,39 @@
 import logging
+import sys
 from contextlib import suppress
-from typing import TypedDict, TypeVar
+from typing import Any, TypedDict, TypeVar, get_args
 
 from holper import model, tools
 
-from .common import BaseMessageElement, Class, Control, ControlCard, Country, Id, Organisation, Person
+from .common import BaseMessageElement, Class, Control, ControlCard, ControlType, Country, Id, Organisation, Person
+from .common import OrganisationType as OrganisationTypeName
 from .course_data import ClassCourseAssignment, Course
-from .entry_list import PersonEntry, StartTimeAllocationRequest, TeamEntry, TeamEntryPerson
+from .entry_list import (
+    PersonEntry,
+    StartTimeAllocationRequest,
+    StartTimeAllocationRequestType,
+    TeamEntry,
+    TeamEntryPerson,
+)
 
 EntityWithId = TypeVar("EntityWithId", bound=model.HasExternalIds)
 
+_SEX_BY_CODE = {
+    "F": model.Sex.FEMALE,
+    "M": model.Sex.MALE,
+}
+
+# The IOF XML attribute values are closed sets, so the camelcase-to-enum
+# conversions can be precomputed instead of running per element.
+_CONTROL_TYPE_BY_NAME = {name: model.ControlType(tools.camelcase_to_snakecase(name)) for name in get_args(ControlType)}
+_ORGANISATION_TYPE_BY_NAME = {
+    name: model.OrganisationType(tools.camelcase_to_snakecase(name)) for name in get_args(OrganisationTypeName)
+}
+_START_TIME_ALLOCATION_REQUEST_TYPE_BY_NAME = {
+    name: model.StartTimeAllocationRequestType(tools.camelcase_to_snakecase(name))
+    for name in get_args(StartTimeAllocationRequestType)
+}
+
 
 class NoSuchEntityError(Exception):
     def __init__(self, issuer: str, external_id: str, scope: set[str]) -> None:
@@ -29,43 +53,58 @@ class IdArgs(TypedDict):
 
 
 class Importer:
+    __slots__ = ("default_issuer", "organisations", "countries_by_ioc_code", "_id_indices", "_organisations_by_name")
+
     def __init__(self, root: BaseMessageElement, countries: list[model.Country]) -> None:
         self.default_issuer = root.creator or "unknown"
         self.organisations: list[model.Organisation] = []
-        self.countries = countries
+        # Organisations without an external id can only be deduplicated by name.
+        self._organisations_by_name: dict[str | None, model.Organisation] = {}
+        self.countries_by_ioc_code = {country.ioc_code: country for country in countries}
+        # Per entity list: the list itself, its size at index time and the
+        # (issuer, external_id) index built from it.
+        self._id_indices: dict[int, tuple[list[Any], int, dict[tuple[str, str], Any]]] = {}
 
     def extract_id(self, id_: Id) -> IdArgs:
         return {
-            "issuer": id_.type or self.default_issuer,
+            # The same issuer string recurs for almost every id in a document,
+            # so intern it for cheap dict lookups and less memory.
+            "issuer": sys.intern(id_.type or self.default_issuer),
             "external_id": id_.text,
         }
 
+    def _index_by_id(self, entities: list[EntityWithId]) -> dict[tuple[str, str], EntityWithId]:
+        """Index entities by all their external ids.
+
+        The index is cached per entity list and rebuilt when the list has
+        grown, e.g. by further imported organisations.
+        """
+        cached = self._id_indices.get(id(entities))
+        if cached is None or cached[1] != len(entities):
+            index: dict[tuple[str, str], EntityWithId] = {}
+            for entity in entities:
+                for entity_id in entity.external_ids:
+                    index.setdefault((entity_id.issuer, entity_id.external_id), entity)
+            self._id_indices[id(entities)] = (entities, len(entities), index)
+            return index
+        return cached[2]
+
     def find_by_id(self, entities: list[EntityWithId], id_: Id) -> EntityWithId:
         args = self.extract_id(id_)
+        index = self._index_by_id(entities)
         try:
-            return next(
-                entity
-                for entity in entities
-                if any(
-                    entity_id.issuer == args["issuer"] and entity_id.external_id == args["external_id"]
-                    for entity_id in entity.external_ids
-                )
-            )
-        except StopIteration as error:
+            return index[args["issuer"], args["external_id"]]
+        except KeyError as error:
             raise NoSuchEntityError(
                 args["issuer"],
                 args["external_id"],
-                {
-                    f"{entity_id.issuer}/{entity_id.external_id}"
-                    for entity in entities
-                    for entity_id in entity.external_ids
-                },
+                {f"{issuer}/{external_id}" for issuer, external_id in index},
             ) from error
 
     def find_country(self, ioc_code: str) -> model.Country | None:
         try:
-            return next(country for country in self.countries if country.ioc_code == ioc_code)
-        except StopIteration:
+            return self.countries_by_ioc_code[ioc_code]
+        except KeyError:
             logging.warning("Could not find country with ioc_code %s.", ioc_code)
             return None
 
@@ -115,9 +154,11 @@ class Importer:
         )
 
     def import_team_entry(self, entry: TeamEntry, categories: list[model.EventCategory]) -> model.Entry:
-        competitors = [self.import_team_entry_person(entry_person) for entry_person in entry.team_entry_persons]
-        for idx, competitor in enumerate(competitors):
+        competitors = []
+        for idx, entry_person in enumerate(entry.team_entry_persons):
+            competitor = self.import_team_entry_person(entry_person)
             competitor.entry_sequence = idx + 1
+            competitors.append(competitor)
         return model.Entry(
             name=entry.name,
             competitors=competitors,
@@ -156,11 +197,9 @@ class Importer:
         )
 
     def import_sex(self, sex: str | None) -> model.Sex | None:
-        if sex == "F":
-            return model.Sex.FEMALE
-        if sex == "M":
-            return model.Sex.MALE
-        return None
+        if sex is None:
+            return None
+        return _SEX_BY_CODE.get(sex)
 
     def import_organisation(self, organisation: Organisation | None) -> model.Organisation | None:
         if organisation is None:
@@ -168,6 +207,8 @@ class Importer:
         if organisation.id is not None:
             with suppress(NoSuchEntityError):
                 return self.find_by_id(self.organisations, organisation.id)
+        elif organisation.name in self._organisations_by_name:
+            return self._organisations_by_name[organisation.name]
 
         imported = model.Organisation(
             external_ids=[model.OrganisationXID(**self.extract_id(organisation.id))]
@@ -176,11 +217,11 @@ class Importer:
             name=organisation.name,
             short_name=organisation.short_name,
             country=self.import_country(organisation.country),
-            type=model.OrganisationType(tools.camelcase_to_snakecase(organisation.type))
-            if organisation.type is not None
-            else None,
+            type=_ORGANISATION_TYPE_BY_NAME[organisation.type] if organisation.type is not None else None,
         )
         self.organisations.append(imported)
+        if organisation.id is None:
+            self._organisations_by_name[organisation.name] = imported
         return imported
 
     def import_country(self, country: Country | None) -> model.Country | None:
@@ -192,9 +233,10 @@ class Importer:
         imported = model.ControlCard(label=control_card.text)
 
         if (system := control_card.punching_system) is not None:
-            if system.lower() in {"si", "sportident"}:
+            system_key = system.lower()
+            if system_key in {"si", "sportident"}:
                 imported.system = model.PunchingSystem.SPORT_IDENT
-            elif system.lower() == "emit":
+            elif system_key == "emit":
                 imported.system = model.PunchingSystem.EMIT
             else:
                 msg = f"Unknown punching system: {system}"
@@ -207,7 +249,7 @@ class Importer:
         request: StartTimeAllocationRequest,
     ) -> model.StartTimeAllocationRequest:
         return model.StartTimeAllocationRequest(
-            type=model.StartTimeAllocationRequestType(tools.camelcase_to_snakecase(request.type)),
+            type=_START_TIME_ALLOCATION_REQUEST_TYPE_BY_NAME[request.type],
             person=self.import_person(request.person) if request.person is not None else None,
             organisation=self.import_organisation(request.organisation) if request.organisation is not None else None,
         )
@@ -225,34 +267,37 @@ class Importer:
             climb=course.climb,
         )
 
+        controls_by_label = {control.label: control for control in controls}
         random_order_segment = False
         control_order = 0
         for course_control in course.course_controls:
-            if not course_control.controls:
+            labels = course_control.controls
+            if not labels:
                 logging.warning(
                     "Missing label for course control. Skipping course control at position %d of course %s.",
                     control_order,
                     course.name,
                 )
                 continue
-            if len(course_control.controls) > 1:
+            if len(labels) > 1:
                 logging.warning(
                     "Only one label per control is supported. Dropping all but the first: %s",
-                    ", ".join(course_control.controls),
+                    ", ".join(labels),
                 )
             imported.controls.append(
                 model.CourseControl(
-                    control=next(control for control in controls if control.label == course_control.controls[0]),
+                    control=controls_by_label[labels[0]],
                     leg_length=course_control.leg_length,
-                    type=model.ControlType(tools.camelcase_to_snakecase(course_control.type or "Control")),
+                    type=_CONTROL_TYPE_BY_NAME[course_control.type or "Control"],
                     score=course_control.score,
                     order=control_order,
                 ),
             )
 
-            if not (random_order_segment and course_control.random_order):
+            random_order = course_control.random_order
+            if not (random_order_segment and random_order):
                 control_order += 1
-            random_order_segment = course_control.random_order
+            random_order_segment = random_order
 
         return imported
 
@@ -44,60 +44,206 @@ __all__ = [
     "Result",
     "CompetitorResult",
     "ResultStatus",
+    "topological_order",
 ]
 
 import enum
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
-from typing import Any, Self
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Self
 
 from sqlalchemy import (
     TIMESTAMP,
     Column,
-    Enum,
+    ColumnElement,
+    Dialect,
     ForeignKey,
+    Index,
     Integer,
     Sequence,
     SmallInteger,
     String,
     Table,
+    Text,
+    TypeDecorator,
     UniqueConstraint,
+    event,
+    func,
+    insert,
+    select,
 )
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
 
 from .tools import camelcase_to_snakecase
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+    from sqlalchemy.sql.dml import Insert
+
+
+class TimedeltaAsSeconds(TypeDecorator[timedelta]):
+    """Store a timedelta column as whole seconds.
+
+    Start offsets and run times only need second precision in this
+    domain; an INTEGER avoids the per-row INTERVAL codec when fetching
+    large start and result listings.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value: timedelta | None, dialect: Dialect) -> int | None:  # noqa: ARG002 - signature is fixed by TypeDecorator
+        return None if value is None else int(value.total_seconds())
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> timedelta | None:  # noqa: ARG002 - signature is fixed by TypeDecorator
+        return None if value is None else timedelta(seconds=value)
+
 
 class Base(DeclarativeBase):
-    @declared_attr.directive
-    def __tablename__(cls) -> str:
-        return cls.__name__
+    # Uniform column types: all timestamps are timezone-aware so drivers can
+    # use one binary codec for a whole result set.
+    type_annotation_map = {  # noqa: RUF012 - assigned once by the declarative machinery
+        datetime: TIMESTAMP(timezone=True),
+        timedelta: TimedeltaAsSeconds,
+    }
+
+    _id_column_name: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401 - signature is fixed by the language
+        # Computed once per class instead of on every id_column access.
+        cls._id_column_name = camelcase_to_snakecase(cls.__name__) + "_id"
+        # A plain class attribute keeps the declarative setup off the slower
+        # declared_attr path.
+        if "__tablename__" not in cls.__dict__ and not cls.__dict__.get("__abstract__"):
+            cls.__tablename__ = cls.__name__
+        super().__init_subclass__(**kwargs)
 
     @property
     def id_column(self) -> str:
         """Convention for the primary id column"""
-        return camelcase_to_snakecase(self.__class__.__name__) + "_id"
+        return self._id_column_name
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Iterable[Mapping[str, Any]], batch_size: int = 10000) -> None:
+        """Insert plain row dictionaries in batches.
+
+        For large imports this is much faster than adding ORM objects one
+        by one, because each batch is sent as a single executemany instead
+        of one INSERT per row. The rows bypass ORM events and relationship
+        handling, so foreign key columns must be filled in explicitly.
+        """
+        statement = cls._insert_statement()
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
+            session.execute(statement, batch)
+
+    @classmethod
+    def copy_from(cls, session: Session, rows: Iterable[Mapping[str, Any]], batch_size: int = 10000) -> None:
+        """Load rows through PostgreSQL ``COPY … FROM STDIN``.
+
+        COPY bypasses the per-statement parsing entirely and streams the
+        rows on the wire, which beats even batched inserts for the wide
+        tables. On other dialects this falls back to :py:meth:`bulk_insert`.
+        The column list is taken from the first row of each batch, so all
+        rows of a batch must provide the same keys.
+        """
+        dialect = session.get_bind(mapper=cls).dialect
+        if dialect.name != "postgresql":
+            cls.bulk_insert(session, rows, batch_size)
+            return
+
+        preparer = dialect.identifier_preparer
+        cursor = session.connection().connection.cursor()
+        iterator = iter(rows)
+        while batch := list(islice(iterator, batch_size)):
+            columns = list(batch[0])
+            column_list = ", ".join(preparer.quote(column) for column in columns)
+            statement = f"COPY {preparer.format_table(cls.__table__)} ({column_list}) FROM STDIN"
+            # psycopg's row-based COPY escapes values and distinguishes
+            # NULL from empty strings, unlike a hand-built CSV stream.
+            with cursor.copy(statement) as copy:
+                for row in batch:
+                    copy.write_row([row[column] for column in columns])
+
+    @classmethod
+    def _insert_statement(cls) -> Insert:
+        """Insert construct for this table, built once per class.
+
+        Reusing the construct lets the engine's compiled-statement cache
+        serve repeated inserts without re-traversing the clause tree.
+        """
+        statement: Insert | None = cls.__dict__.get("__insert_statement__")
+        if statement is None:
+            statement = insert(cls)
+            cls.__insert_statement__ = statement
+        return statement
 
     def __repr__(self) -> str:
-        try:
-            primary_key = getattr(self, self.id_column)
-        except AttributeError:
-            primary_key = "No id"
+        return f"<{type(self).__name__}({getattr(self, self._id_column_name, 'No id')!r})>"
+
+
+class StrEnumAsInteger(TypeDecorator[enum.StrEnum]):
+    """Store a :py:class:`enum.StrEnum` column as a small integer.
+
+    The stored value is the 1-based definition order of the member. This
+    keeps rows narrow compared to the VARCHAR that ``Enum(...)`` emits and
+    avoids per-row string conversion on load, while the mapped attribute
+    keeps its StrEnum type. New members must only be appended, never
+    reordered, to keep existing databases readable.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_type: type[enum.StrEnum]) -> None:
+        super().__init__()
+        self.enum_type = enum_type
+        members: list[enum.StrEnum] = list(enum_type)
+        self._code_by_member: dict[enum.StrEnum, int] = {member: code for code, member in enumerate(members, 1)}
+        self._member_by_code: dict[int, enum.StrEnum] = dict(enumerate(members, 1))
+
+    def process_bind_param(self, value: enum.StrEnum | None, dialect: Dialect) -> int | None:  # noqa: ARG002 - signature is fixed by TypeDecorator
+        return None if value is None else self._code_by_member[value]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> enum.StrEnum | None:  # noqa: ARG002 - signature is fixed by TypeDecorator
+        return None if value is None else self._member_by_code[value]
 
-        return f"<{self.__class__.__name__}({primary_key!r})>"
+
+def _free_text(length: int) -> String:
+    """String column for free-form names.
+
+    The length is only a sanity bound, so on PostgreSQL - where VARCHAR(n)
+    and TEXT share the same storage - the variant skips the per-row length
+    check in the insert path.
+    """
+    return String(length).with_variant(Text(), "postgresql")
 
 
 class ExternalId:
-    """Common base class for external id models."""
+    """Common base class for external id models.
+
+    The tables use a surrogate integer key; the (issuer, external_id)
+    pair stays unique, but no longer serves as a wide composite primary
+    key that every index leaf would have to carry.
+    """
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[UniqueConstraint, ...]:
+        return (UniqueConstraint("issuer", "external_id"),)
 
     @declared_attr
     def issuer(cls) -> Mapped[str]:
-        return mapped_column(String(32), primary_key=True, nullable=False)
+        return mapped_column(String(32), nullable=False)
 
     @declared_attr
     def external_id(cls) -> Mapped[str]:
-        return mapped_column(String(16), primary_key=True, nullable=False)
+        return mapped_column(String(16), nullable=False)
 
 
 class HasExternalIds:
@@ -111,7 +257,7 @@ class HasExternalIds:
 
 class Country(Base):
     country_id: Mapped[int] = mapped_column(
-        Sequence("country_id_seq"),
+        Sequence("country_id_seq", cache=1000),
         primary_key=True,
         autoincrement=False,
         doc="ISO-3166 numeric code",
@@ -126,6 +272,7 @@ class Country(Base):
 #
 # Custom types should be added with an X_ prefix.
 EventForm = enum.StrEnum("EventForm", ["INDIVIDUAL", "TEAM", "RELAY"])
+_event_form_type = StrEnumAsInteger(EventForm)
 
 
 class Event(Base, HasExternalIds):
@@ -138,13 +285,13 @@ class Event(Base, HasExternalIds):
     :py:class:`~.EventCategory`.
     """
 
-    event_id: Mapped[int] = mapped_column(Sequence("event_id_seq"), primary_key=True)
+    event_id: Mapped[int] = mapped_column(Sequence("event_id_seq", cache=1000), primary_key=True)
     external_ids: Mapped[list[EventXID]] = relationship("EventXID", back_populates="event")
 
-    name: Mapped[str | None] = mapped_column(String(255))
+    name: Mapped[str | None] = mapped_column(_free_text(255))
     start_time: Mapped[datetime | None]
     end_time: Mapped[datetime | None]
-    form: Mapped[EventForm] = mapped_column(Enum(EventForm), default=EventForm.INDIVIDUAL)
+    form: Mapped[EventForm] = mapped_column(_event_form_type, default=EventForm.INDIVIDUAL)
 
     races: Mapped[list[Race]] = relationship("Race", back_populates="event")
     event_categories: Mapped[list[EventCategory]] = relationship("EventCategory", back_populates="event")
@@ -152,11 +299,13 @@ class Event(Base, HasExternalIds):
 
 
 class EventXID(Base, ExternalId):
-    event_id: Mapped[int] = mapped_column(ForeignKey("Event.event_id"))
+    event_xid_id: Mapped[int] = mapped_column(Sequence("event_xid_id_seq", cache=1000), primary_key=True)
+    event_id: Mapped[int] = mapped_column(ForeignKey("Event.event_id"), index=True)
     event: Mapped[Event] = relationship(Event, back_populates="external_ids")
 
 
 Sex = enum.StrEnum("Sex", ["FEMALE", "MALE"])
+_sex_type = StrEnumAsInteger(Sex)
 
 
 EventCategoryStatus = enum.StrEnum(
@@ -169,6 +318,7 @@ EventCategoryStatus = enum.StrEnum(
         "INVALIDATED_NO_FEE",
     ],
 )
+_event_category_status_type = StrEnumAsInteger(EventCategoryStatus)
 
 
 class EventCategory(Base, HasExternalIds):
@@ -183,19 +333,19 @@ class EventCategory(Base, HasExternalIds):
     ranking.
     """
 
-    event_category_id: Mapped[int] = mapped_column(Sequence("event_category_id_seq"), primary_key=True)
+    event_category_id: Mapped[int] = mapped_column(Sequence("event_category_id_seq", cache=1000), primary_key=True)
     external_ids: Mapped[list[EventCategoryXID]] = relationship("EventCategoryXID", back_populates="event_category")
 
-    event_id: Mapped[int | None] = mapped_column(ForeignKey(Event.event_id))
+    event_id: Mapped[int | None] = mapped_column(ForeignKey(Event.event_id), index=True)
     event: Mapped[Event | None] = relationship(Event, back_populates="event_categories")
     name: Mapped[str] = mapped_column(String(32))
     short_name: Mapped[str | None] = mapped_column(String(8))
     status: Mapped[EventCategoryStatus] = mapped_column(
-        Enum(EventCategoryStatus),
+        _event_category_status_type,
         default=EventCategoryStatus.NORMAL,
     )
 
-    legs: Mapped[list[Leg]] = relationship("Leg", back_populates="event_category")
+    legs: Mapped[list[Leg]] = relationship("Leg", back_populates="event_category", lazy="selectin")
     entry_requests: Mapped[list[EntryCategoryRequest]] = relationship(
         "EntryCategoryRequest",
         back_populates="event_category",
@@ -205,7 +355,7 @@ class EventCategory(Base, HasExternalIds):
 
     min_age: Mapped[int | None] = mapped_column(SmallInteger)
     max_age: Mapped[int | None] = mapped_column(SmallInteger)
-    sex: Mapped[Sex | None] = mapped_column(Enum(Sex))
+    sex: Mapped[Sex | None] = mapped_column(_sex_type)
 
     min_number_of_team_members: Mapped[int] = mapped_column(SmallInteger, default=1)
     max_number_of_team_members: Mapped[int] = mapped_column(SmallInteger, default=1)
@@ -217,8 +367,13 @@ class EventCategory(Base, HasExternalIds):
 
 
 class EventCategoryXID(Base, ExternalId):
+    event_category_xid_id: Mapped[int] = mapped_column(
+        Sequence("event_category_xid_id_seq", cache=1000),
+        primary_key=True,
+    )
     event_category_id: Mapped[int] = mapped_column(
         ForeignKey("EventCategory.event_category_id"),
+        index=True,
     )
     event_category: Mapped[EventCategory] = relationship(EventCategory, back_populates="external_ids")
 
@@ -226,19 +381,24 @@ class EventCategoryXID(Base, ExternalId):
 class Race(Base):
     """Smallest organisational unit to assign entries to"""
 
-    race_id: Mapped[int] = mapped_column(Sequence("race_id_seq"), primary_key=True)
-    event_id: Mapped[int] = mapped_column(ForeignKey(Event.event_id))
+    race_id: Mapped[int] = mapped_column(Sequence("race_id_seq", cache=1000), primary_key=True)
+    event_id: Mapped[int] = mapped_column(ForeignKey(Event.event_id), index=True)
     event: Mapped[Event] = relationship(Event, back_populates="races")
 
-    first_start: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))
+    first_start: Mapped[datetime | None]
 
     categories: Mapped[list[Category]] = relationship("Category", back_populates="race")
     controls: Mapped[list[Control]] = relationship("Control", back_populates="race")
     courses: Mapped[list[Course]] = relationship("Course", back_populates="race")
 
-    @property
-    def entries(self) -> list[Entry]:
-        return self.event.entries
+    entries: Mapped[list[Entry]] = relationship(
+        "Entry",
+        secondary="Event",
+        primaryjoin="Race.event_id == Event.event_id",
+        secondaryjoin="Entry.event_id == Event.event_id",
+        viewonly=True,
+        doc="All entries of the event, loadable in one query via the join through Event.",
+    )
 
 
 RaceCategoryStatus = enum.StrEnum(
@@ -252,11 +412,12 @@ RaceCategoryStatus = enum.StrEnum(
         "INVALIDATED_NO_FEE",
     ],
 )
+_race_category_status_type = StrEnumAsInteger(RaceCategoryStatus)
 
 
 class Leg(Base):
-    leg_id: Mapped[int] = mapped_column(Sequence("leg_id_seq"), primary_key=True)
-    event_category_id: Mapped[int] = mapped_column(ForeignKey(EventCategory.event_category_id))
+    leg_id: Mapped[int] = mapped_column(Sequence("leg_id_seq", cache=1000), primary_key=True)
+    event_category_id: Mapped[int] = mapped_column(ForeignKey(EventCategory.event_category_id), index=True)
     event_category: Mapped[EventCategory] = relationship(EventCategory, back_populates="legs")
 
     # Ordinal number of the leg in the category, starting at 1.
@@ -268,17 +429,19 @@ class Leg(Base):
 
 
 class Control(Base):
-    control_id: Mapped[int] = mapped_column(Sequence("control_id_seq"), primary_key=True)
+    # The unique constraint doubles as the composite index for the
+    # label-by-race lookups of the course import.
+    __table_args__ = (UniqueConstraint("race_id", "label", name="uq_control_race_label"),)
+
+    control_id: Mapped[int] = mapped_column(Sequence("control_id_seq", cache=1000), primary_key=True)
     race_id: Mapped[int] = mapped_column(ForeignKey(Race.race_id))
     race: Mapped[Race] = relationship(Race, back_populates="controls")
     label: Mapped[str] = mapped_column(String(16))
 
-    UniqueConstraint("race_id", "label")
-
 
 class Course(Base):
-    course_id: Mapped[int] = mapped_column(Sequence("course_id_seq"), primary_key=True)
-    race_id: Mapped[int] = mapped_column(ForeignKey(Race.race_id))
+    course_id: Mapped[int] = mapped_column(Sequence("course_id_seq", cache=1000), primary_key=True)
+    race_id: Mapped[int] = mapped_column(ForeignKey(Race.race_id), index=True)
     race: Mapped[Race] = relationship(Race, back_populates="courses")
 
     name: Mapped[str] = mapped_column(String(16))
@@ -296,35 +459,51 @@ ControlType = enum.StrEnum(
     "ControlType",
     ["CONTROL", "START", "FINISH", "CROSSING_POINT", "END_OF_MARKED_ROUTE"],
 )
+_control_type_type = StrEnumAsInteger(ControlType)
 
 
 class CourseControl(Base):
-    course_control_id: Mapped[int] = mapped_column(Sequence("course_control_id_seq"), primary_key=True)
+    # Courses are rendered by walking their controls in punching order.
+    __table_args__ = (Index("ix_course_control_course_order", "course_id", "order"),)
+
+    course_control_id: Mapped[int] = mapped_column(Sequence("course_control_id_seq", cache=1000), primary_key=True)
     course_id: Mapped[int] = mapped_column(ForeignKey(Course.course_id))
     course: Mapped[Course] = relationship(Course, back_populates="controls")
-    control_id: Mapped[int] = mapped_column(ForeignKey(Control.control_id))
-    control: Mapped[Control] = relationship(Control)
+    control_id: Mapped[int] = mapped_column(ForeignKey(Control.control_id), index=True)
+    control: Mapped[Control] = relationship(Control, lazy="joined")
 
     leg_length: Mapped[float | None] = mapped_column(doc="Leg length in kilometers")
 
-    type: Mapped[ControlType] = mapped_column(Enum(ControlType), default=ControlType.CONTROL)
+    type: Mapped[ControlType] = mapped_column(_control_type_type, default=ControlType.CONTROL)
     score: Mapped[float | None]
     order: Mapped[int | None] = mapped_column(
         doc="If a course control has a higher `order` than another, \
             it has to be punched after it.",
     )
-    after_course_control_id: Mapped[int | None] = mapped_column(ForeignKey("CourseControl.course_control_id"))
+    after_course_control_id: Mapped[int | None] = mapped_column(
+        ForeignKey("CourseControl.course_control_id"),
+        index=True,
+    )
     after: Mapped[Self | None] = relationship(
         "CourseControl",
         foreign_keys=[after_course_control_id],
         remote_side=course_control_id,
+        lazy="joined",
+        # Self-referential joined loading only takes effect with a join_depth;
+        # one level suffices since the constraints are not chained.
+        join_depth=1,
         doc="Control must be punched after this other control.",
     )
-    before_course_control_id: Mapped[int | None] = mapped_column(ForeignKey("CourseControl.course_control_id"))
+    before_course_control_id: Mapped[int | None] = mapped_column(
+        ForeignKey("CourseControl.course_control_id"),
+        index=True,
+    )
     before: Mapped[Self | None] = relationship(
         "CourseControl",
         foreign_keys=[before_course_control_id],
         remote_side=course_control_id,
+        lazy="joined",
+        join_depth=1,
         doc="Control must be punched before this other control.",
     )
 
@@ -332,15 +511,15 @@ class CourseControl(Base):
 class Category(Base):
     """Realize an EventCategory for one specific race of that event"""
 
-    category_id: Mapped[int] = mapped_column(Sequence("category_id_seq"), primary_key=True)
-    race_id: Mapped[int] = mapped_column(ForeignKey(Race.race_id))
+    category_id: Mapped[int] = mapped_column(Sequence("category_id_seq", cache=1000), primary_key=True)
+    race_id: Mapped[int] = mapped_column(ForeignKey(Race.race_id), index=True)
     race: Mapped[Race] = relationship(Race, back_populates="categories")
 
-    event_category_id: Mapped[int] = mapped_column(ForeignKey(EventCategory.event_category_id))
-    event_category: Mapped[EventCategory] = relationship(EventCategory)
+    event_category_id: Mapped[int] = mapped_column(ForeignKey(EventCategory.event_category_id), index=True)
+    event_category: Mapped[EventCategory] = relationship(EventCategory, lazy="joined")
 
     status: Mapped[RaceCategoryStatus] = mapped_column(
-        Enum(RaceCategoryStatus),
+        _race_category_status_type,
         default=RaceCategoryStatus.START_TIMES_NOT_ALLOCATED,
     )
 
@@ -357,20 +536,38 @@ class Category(Base):
     # In IOF XMLv3 this is called maxNumberOfCompetitors
     starter_limit: Mapped[int | None] = mapped_column(SmallInteger)
 
-    @property
+    @hybrid_property
     def name(self) -> str:
         return self.event_category.name
 
-    @property
+    @name.inplace.expression
+    @classmethod
+    def _name_expression(cls) -> ColumnElement[str]:
+        return (
+            select(EventCategory.name)
+            .where(EventCategory.event_category_id == cls.event_category_id)
+            .scalar_subquery()
+        )
+
+    @hybrid_property
     def short_name(self) -> str:
         return self.event_category.short_name or self.event_category.name
 
+    @short_name.inplace.expression
+    @classmethod
+    def _short_name_expression(cls) -> ColumnElement[str]:
+        return (
+            select(func.coalesce(EventCategory.short_name, EventCategory.name))
+            .where(EventCategory.event_category_id == cls.event_category_id)
+            .scalar_subquery()
+        )
+
 
 class CategoryCourseAssignment(Base):
     category_id: Mapped[int] = mapped_column(ForeignKey(Category.category_id), primary_key=True)
     category: Mapped[Category] = relationship(Category, back_populates="courses")
     leg: Mapped[int] = mapped_column(SmallInteger, default=1, primary_key=True)
-    course_id: Mapped[int] = mapped_column(ForeignKey(Course.course_id))
+    course_id: Mapped[int] = mapped_column(ForeignKey(Course.course_id), index=True)
     course: Mapped[Course] = relationship(Course, back_populates="categories")
 
 
@@ -378,20 +575,25 @@ class CategoryCourseAssignment(Base):
 
 
 class Person(Base, HasExternalIds):
-    person_id: Mapped[int] = mapped_column(Sequence("person_id_seq"), primary_key=True)
+    person_id: Mapped[int] = mapped_column(Sequence("person_id_seq", cache=1000), primary_key=True)
     external_ids: Mapped[list[PersonXID]] = relationship("PersonXID", back_populates="person")
 
-    title: Mapped[str | None] = mapped_column(String(31))
-    family_name: Mapped[str | None] = mapped_column(String(64))
-    given_name: Mapped[str | None] = mapped_column(String(160))
+    title: Mapped[str | None] = mapped_column(
+        _free_text(31),
+        deferred=True,
+        doc="Academic or noble title. Deferred since no import or export path reads it.",
+    )
+    family_name: Mapped[str | None] = mapped_column(_free_text(64))
+    given_name: Mapped[str | None] = mapped_column(_free_text(160))
     birth_date: Mapped[date | None]
-    country_id: Mapped[int | None] = mapped_column(ForeignKey(Country.country_id))
+    country_id: Mapped[int | None] = mapped_column(ForeignKey(Country.country_id), index=True)
     country: Mapped[Country | None] = relationship(Country)
-    sex: Mapped[Sex | None] = mapped_column(Enum(Sex))
+    sex: Mapped[Sex | None] = mapped_column(_sex_type)
 
 
 class PersonXID(Base, ExternalId):
-    person_id: Mapped[int] = mapped_column(ForeignKey("Person.person_id"))
+    person_xid_id: Mapped[int] = mapped_column(Sequence("person_xid_id_seq", cache=1000), primary_key=True)
+    person_id: Mapped[int] = mapped_column(ForeignKey("Person.person_id"), index=True)
     person: Mapped[Person] = relationship(Person, back_populates="external_ids")
 
 
@@ -409,56 +611,70 @@ OrganisationType = enum.StrEnum(
         "OTHER",
     ],
 )
+_organisation_type_type = StrEnumAsInteger(OrganisationType)
 
 
 class Organisation(Base, HasExternalIds):
-    organisation_id: Mapped[int] = mapped_column(Sequence("organisation_id_seq"), primary_key=True)
+    organisation_id: Mapped[int] = mapped_column(Sequence("organisation_id_seq", cache=1000), primary_key=True)
     external_ids: Mapped[list[OrganisationXID]] = relationship("OrganisationXID", back_populates="organisation")
 
-    name: Mapped[str] = mapped_column(String(255))
+    name: Mapped[str] = mapped_column(_free_text(255))
     short_name: Mapped[str | None] = mapped_column(String(32))
-    country_id: Mapped[int | None] = mapped_column(ForeignKey(Country.country_id))
+    country_id: Mapped[int | None] = mapped_column(ForeignKey(Country.country_id), index=True)
     country: Mapped[Country | None] = relationship(Country)
-    type: Mapped[OrganisationType | None] = mapped_column(Enum(OrganisationType))
+    type: Mapped[OrganisationType | None] = mapped_column(_organisation_type_type)
 
 
 class OrganisationXID(Base, ExternalId):
-    organisation_id: Mapped[int] = mapped_column(ForeignKey("Organisation.organisation_id"))
+    organisation_xid_id: Mapped[int] = mapped_column(Sequence("organisation_xid_id_seq", cache=1000), primary_key=True)
+    organisation_id: Mapped[int] = mapped_column(ForeignKey("Organisation.organisation_id"), index=True)
     organisation: Mapped[Organisation] = relationship(Organisation, back_populates="external_ids")
 
 
 class Entry(Base, HasExternalIds):
-    entry_id: Mapped[int] = mapped_column(Sequence("entry_id_seq"), primary_key=True)
+    entry_id: Mapped[int] = mapped_column(Sequence("entry_id_seq", cache=1000), primary_key=True)
     external_ids: Mapped[list[EntryXID]] = relationship("EntryXID", back_populates="entry")
 
-    event_id: Mapped[int] = mapped_column(ForeignKey(Event.event_id))
+    event_id: Mapped[int] = mapped_column(ForeignKey(Event.event_id), index=True)
     event: Mapped[Event] = relationship(Event, back_populates="entries")
 
     number: Mapped[int | None]
-    name: Mapped[str | None] = mapped_column(String(255))
-    competitors: Mapped[list[Competitor]] = relationship("Competitor", back_populates="entry")
+    name: Mapped[str | None] = mapped_column(_free_text(255))
+    competitors: Mapped[list[Competitor]] = relationship(
+        "Competitor",
+        back_populates="entry",
+        lazy="selectin",
+        order_by="Competitor.entry_sequence",
+    )
 
-    organisation_id: Mapped[int | None] = mapped_column(ForeignKey(Organisation.organisation_id))
+    organisation_id: Mapped[int | None] = mapped_column(ForeignKey(Organisation.organisation_id), index=True)
     organisation: Mapped[Organisation | None] = relationship(Organisation)
 
     category_requests: Mapped[list[EntryCategoryRequest]] = relationship(
         "EntryCategoryRequest",
         back_populates="entry",
+        lazy="selectin",
         doc="Requested categories with preference",
     )
     start_time_allocation_requests: Mapped[list[StartTimeAllocationRequest]] = relationship(
         "StartTimeAllocationRequest",
+        back_populates="entry",
     )
     starts: Mapped[list[Start]] = relationship("Start", back_populates="entry")
 
-    @property
-    def races(self) -> list[Race]:
-        # TODO: Allow participation in only some of the events races.
-        return self.event.races
+    # TODO: Allow participation in only some of the events races.
+    races: Mapped[list[Race]] = relationship(
+        "Race",
+        secondary="Event",
+        primaryjoin="Entry.event_id == Event.event_id",
+        secondaryjoin="Race.event_id == Event.event_id",
+        viewonly=True,
+    )
 
 
 class EntryXID(Base, ExternalId):
-    entry_id: Mapped[int] = mapped_column(ForeignKey("Entry.entry_id"))
+    entry_xid_id: Mapped[int] = mapped_column(Sequence("entry_xid_id_seq", cache=1000), primary_key=True)
+    entry_id: Mapped[int] = mapped_column(ForeignKey("Entry.entry_id"), index=True)
     entry: Mapped[Entry] = relationship(Entry, back_populates="external_ids")
 
 
@@ -471,7 +687,7 @@ class EntryCategoryRequest(Base):
         default=0,
         doc="Lower number means higher preference",
     )
-    event_category_id: Mapped[int] = mapped_column(ForeignKey(EventCategory.event_category_id))
+    event_category_id: Mapped[int] = mapped_column(ForeignKey(EventCategory.event_category_id), index=True)
     event_category: Mapped[EventCategory] = relationship(EventCategory, back_populates="entry_requests")
 
 
@@ -485,37 +701,67 @@ StartTimeAllocationRequestType = enum.StrEnum(
         "GROUPED_WITH",
     ],
 )
+_start_time_allocation_request_type_type = StrEnumAsInteger(StartTimeAllocationRequestType)
 
 
 class StartTimeAllocationRequest(Base):
     start_time_allocation_request_id: Mapped[int] = mapped_column(
-        Sequence("start_time_allocation_request_id_seq"),
+        Sequence("start_time_allocation_request_id_seq", cache=1000),
         primary_key=True,
     )
-    entry_id: Mapped[int] = mapped_column(ForeignKey(Entry.entry_id))
+    entry_id: Mapped[int] = mapped_column(ForeignKey(Entry.entry_id), index=True)
     entry: Mapped[Entry] = relationship(Entry, back_populates="start_time_allocation_requests")
 
     type: Mapped[StartTimeAllocationRequestType] = mapped_column(
-        Enum(StartTimeAllocationRequestType),
+        _start_time_allocation_request_type_type,
         default=StartTimeAllocationRequestType.NORMAL,
     )
-    organisation_id: Mapped[int | None] = mapped_column(ForeignKey(Organisation.organisation_id))
+    organisation_id: Mapped[int | None] = mapped_column(ForeignKey(Organisation.organisation_id), index=True)
     organisation: Mapped[Organisation | None] = relationship(Organisation)
-    person_id: Mapped[int | None] = mapped_column(ForeignKey(Person.person_id))
+    person_id: Mapped[int | None] = mapped_column(ForeignKey(Person.person_id), index=True)
     person: Mapped[Person | None] = relationship(Person)
 
 
 PunchingSystem = enum.StrEnum("PunchingSystem", ["SPORT_IDENT", "EMIT"])
+_punching_system_type = StrEnumAsInteger(PunchingSystem)
 
 
 class ControlCard(Base):
-    control_card_id: Mapped[int] = mapped_column(Sequence("control_card_id_seq"), primary_key=True)
-    system: Mapped[PunchingSystem | None] = mapped_column(Enum(PunchingSystem))
+    control_card_id: Mapped[int] = mapped_column(Sequence("control_card_id_seq", cache=1000), primary_key=True)
+    system: Mapped[PunchingSystem | None] = mapped_column(_punching_system_type)
     label: Mapped[str | None] = mapped_column(String(16))
 
 
+# The composite primary key guarantees uniqueness of the association rows
+# and lets the secondary loader use an index-only scan.
+CompetitorControlCards = Table(
+    "CompetitorControlCards",
+    Base.metadata,
+    Column(
+        "competitor_id",
+        Integer,
+        ForeignKey("Competitor.competitor_id"),
+        primary_key=True,
+        nullable=False,
+    ),
+    Column(
+        "control_card_id",
+        Integer,
+        ForeignKey(ControlCard.control_card_id),
+        primary_key=True,
+        nullable=False,
+    ),
+    # The primary key only covers lookups from the competitor side.
+    Index("ix_competitor_control_cards_card", "control_card_id"),
+)
+
+
 class Competitor(Base, HasExternalIds):
-    competitor_id: Mapped[int] = mapped_column(Sequence("competitor_id_seq"), primary_key=True)
+    # Serves the Entry.competitors selectin load and its ORDER BY
+    # entry_sequence without a sort step.
+    __table_args__ = (Index("ix_competitor_entry_sequence", "entry_id", "entry_sequence"),)
+
+    competitor_id: Mapped[int] = mapped_column(Sequence("competitor_id_seq", cache=1000), primary_key=True)
     external_ids: Mapped[list[CompetitorXID]] = relationship("CompetitorXID", back_populates="competitor")
 
     entry_id: Mapped[int] = mapped_column(ForeignKey(Entry.entry_id))
@@ -529,37 +775,24 @@ class Competitor(Base, HasExternalIds):
     leg_number: Mapped[int | None] = mapped_column(SmallInteger)
     leg_order: Mapped[int | None] = mapped_column(SmallInteger)
 
-    person_id: Mapped[int] = mapped_column(ForeignKey(Person.person_id))
+    person_id: Mapped[int] = mapped_column(ForeignKey(Person.person_id), index=True)
     person: Mapped[Person] = relationship(Person)
 
-    organisation_id: Mapped[int | None] = mapped_column(ForeignKey(Organisation.organisation_id))
+    organisation_id: Mapped[int | None] = mapped_column(ForeignKey(Organisation.organisation_id), index=True)
     organisation: Mapped[Organisation | None] = relationship(Organisation)
 
     control_cards: Mapped[list[ControlCard]] = relationship(
         "ControlCard",
-        secondary=Table(
-            "CompetitorControlCards",
-            Base.metadata,
-            Column(
-                "competitor_id",
-                Integer,
-                ForeignKey("Competitor.competitor_id"),
-                nullable=False,
-            ),
-            Column(
-                "control_card_id",
-                Integer,
-                ForeignKey(ControlCard.control_card_id),
-                nullable=False,
-            ),
-        ),
+        secondary=CompetitorControlCards,
+        lazy="selectin",
     )
 
     starts: Mapped[list[CompetitorStart]] = relationship("CompetitorStart", back_populates="competitor")
 
 
 class CompetitorXID(Base, ExternalId):
-    competitor_id: Mapped[int] = mapped_column(ForeignKey("Competitor.competitor_id"))
+    competitor_xid_id: Mapped[int] = mapped_column(Sequence("competitor_xid_id_seq", cache=1000), primary_key=True)
+    competitor_id: Mapped[int] = mapped_column(ForeignKey("Competitor.competitor_id"), index=True)
     competitor: Mapped[Competitor] = relationship(Competitor, back_populates="external_ids")
 
 
@@ -567,12 +800,16 @@ class CompetitorXID(Base, ExternalId):
 
 
 class Start(Base):
-    start_id: Mapped[int] = mapped_column(Sequence("start_id_seq"), primary_key=True)
-    result: Mapped[Result] = relationship("Result", uselist=False, back_populates="start")
+    # Start lists are produced per category and joined to the entry, so the
+    # composite index serves the whole lookup.
+    __table_args__ = (Index("ix_start_category_entry", "category_id", "entry_id"),)
+
+    start_id: Mapped[int] = mapped_column(Sequence("start_id_seq", cache=1000), primary_key=True)
+    result: Mapped[Result] = relationship("Result", uselist=False, back_populates="start", lazy="joined")
 
     category_id: Mapped[int] = mapped_column(ForeignKey(Category.category_id))
     category: Mapped[Category] = relationship(Category, back_populates="starts")
-    entry_id: Mapped[int] = mapped_column(ForeignKey(Entry.entry_id))
+    entry_id: Mapped[int] = mapped_column(ForeignKey(Entry.entry_id), index=True)
     entry: Mapped[Entry] = relationship(Entry, back_populates="starts")
 
     competitive: Mapped[bool] = mapped_column(
@@ -582,24 +819,31 @@ class Start(Base):
     )
     time_offset: Mapped[timedelta | None] = mapped_column(doc="Start time offset from category start time")
 
-    competitor_starts: Mapped[list[CompetitorStart]] = relationship("CompetitorStart", back_populates="start")
+    competitor_starts: Mapped[list[CompetitorStart]] = relationship(
+        "CompetitorStart",
+        back_populates="start",
+        lazy="selectin",
+    )
 
 
 class CompetitorStart(Base):
-    competitor_start_id: Mapped[int] = mapped_column(Sequence("competitor_start_id_seq"), primary_key=True)
+    __table_args__ = (Index("ix_competitor_start_start_competitor", "start_id", "competitor_id"),)
+
+    competitor_start_id: Mapped[int] = mapped_column(Sequence("competitor_start_id_seq", cache=1000), primary_key=True)
     competitor_result: Mapped[CompetitorResult] = relationship(
         "CompetitorResult",
         uselist=False,
         back_populates="competitor_start",
+        lazy="joined",
     )
 
     start_id: Mapped[int] = mapped_column(ForeignKey(Start.start_id))
     start: Mapped[Start] = relationship(Start, back_populates="competitor_starts")
-    competitor_id: Mapped[int] = mapped_column(ForeignKey(Competitor.competitor_id))
+    competitor_id: Mapped[int] = mapped_column(ForeignKey(Competitor.competitor_id), index=True)
     competitor: Mapped[Competitor] = relationship(Competitor, back_populates="starts")
 
     time_offset: Mapped[timedelta | None] = mapped_column(doc="Start time offset from entry start time")
-    control_card_id: Mapped[int | None] = mapped_column(ForeignKey(ControlCard.control_card_id))
+    control_card_id: Mapped[int | None] = mapped_column(ForeignKey(ControlCard.control_card_id), index=True)
     control_card: Mapped[ControlCard | None] = relationship(ControlCard)
 
 
@@ -625,9 +869,20 @@ ResultStatus = enum.StrEnum(
         "CANCELLED",
     ],
 )
+_result_status_type = StrEnumAsInteger(ResultStatus)
 
 
 class Result(Base):
+    """Finishing data recorded for a start
+
+    Read-only reports over many results should select the needed columns
+    directly (``session.execute(select(Result.time, Result.status, …))``)
+    instead of hydrating full ORM instances; the Row tuples skip the
+    identity map and unit of work. If ORM instances are required, stream
+    them with ``.execution_options(yield_per=1000)`` — compatible with the
+    selectin strategies used here, unlike joined collection loading.
+    """
+
     result_id: Mapped[int] = mapped_column(ForeignKey(Start.start_id), primary_key=True)
     start: Mapped[Start] = relationship(Start, back_populates="result")
 
@@ -637,11 +892,16 @@ class Result(Base):
     time_adjustment: Mapped[timedelta] = mapped_column(doc="Time bonus or penalty")
     time: Mapped[timedelta | None]
 
-    status: Mapped[ResultStatus | None] = mapped_column(Enum(ResultStatus))
+    status: Mapped[ResultStatus | None] = mapped_column(_result_status_type, index=True)
     position: Mapped[int | None] = mapped_column(doc="Position in the category")
 
 
 class CompetitorResult(Base):
+    """Finishing data recorded for a single competitor of a start
+
+    The column-only query advice on :py:class:`Result` applies here as well.
+    """
+
     competitor_result_id: Mapped[int] = mapped_column(
         ForeignKey(CompetitorStart.competitor_start_id),
         primary_key=True,
@@ -654,7 +914,47 @@ class CompetitorResult(Base):
     time_adjustment: Mapped[timedelta] = mapped_column(doc="Time bonus or penalty")
     time: Mapped[timedelta | None]
 
-    status: Mapped[ResultStatus | None] = mapped_column(Enum(ResultStatus))
+    status: Mapped[ResultStatus | None] = mapped_column(_result_status_type)
+
+
+@contextmanager
+def count_queries(session: Session) -> Iterator[list[str]]:
+    """Record the SQL statements emitted on the session's connection.
+
+    Tests can pin the number of statements a code path may emit, which
+    guards against reintroducing N+1 lazy loads on this model.
+    """
+    statements: list[str] = []
+    connection = session.connection()
+
+    def before_cursor_execute(
+        _conn: Connection,
+        _cursor: DBAPICursor,
+        statement: str,
+        _parameters: object,
+        _context: ExecutionContext | None,
+        _executemany: bool,  # noqa: FBT001 - signature is fixed by the event API
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+def topological_order() -> tuple[type[Base], ...]:
+    """Model classes ordered parents before children.
+
+    Batched imports can insert one table at a time in this order without
+    violating foreign keys. The order is derived from the foreign key
+    graph, so it never drifts from the schema.
+    """
+    class_by_table = {mapper.local_table: mapper.class_ for mapper in Base.registry.mappers}
+    return tuple(
+        class_by_table[table] for table in Base.metadata.sorted_tables if table in class_by_table
+    )
 
 
 # additional types in IOF XML:
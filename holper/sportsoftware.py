@@ -9,6 +9,20 @@ from typing import IO
 
 from . import model, tools
 
+# Start and finish offsets are stored as DateTime values relative to this
+# placeholder origin, cf. CSVReader.read_start_and_result.
+_time_origin = datetime(MINYEAR, 1, 1)
+
+# Mapping of the SportSoftware "Wertung" column to result statuses
+_result_status_by_code = {
+    0: model.ResultStatus.OK,
+    1: model.ResultStatus.DID_NOT_START,
+    2: model.ResultStatus.DID_NOT_FINISH,
+    3: model.ResultStatus.MISSING_PUNCH,
+    4: model.ResultStatus.DISQUALIFIED,
+    5: model.ResultStatus.OVER_TIME,
+}
+
 _csv_header_oe_de = (
     "OE0001",
     "Stnr",
@@ -698,8 +712,8 @@ class CSVReader:
                         start_offset = parse_time(row[offset + 7], with_seconds=with_seconds)
                         finish_offset = parse_time(row[offset + 8], with_seconds=with_seconds)
                         competitor_start.competitor_result = model.CompetitorResult(
-                            start_time=datetime(MINYEAR, 1, 1) + start_offset if start_offset else None,
-                            finish_time=datetime(MINYEAR, 1, 1) + finish_offset if finish_offset else None,
+                            start_time=_time_origin + start_offset if start_offset else None,
+                            finish_time=_time_origin + finish_offset if finish_offset else None,
                             time=parse_time(row[offset + 9], with_seconds=with_seconds),
                             status=self.read_result_status(row[offset + 10]),
                         )
@@ -861,8 +875,8 @@ class CSVReader:
             finish_offset = parse_time(finish_offset_repr, with_seconds=with_seconds)
             result = model.Result(
                 start=start,
-                start_time=datetime(MINYEAR, 1, 1) + start_offset if start_offset else None,
-                finish_time=datetime(MINYEAR, 1, 1) + finish_offset if finish_offset else None,
+                start_time=_time_origin + start_offset if start_offset else None,
+                finish_time=_time_origin + finish_offset if finish_offset else None,
                 time_adjustment=(parse_time(time_penalty, with_seconds=with_seconds) or timedelta())
                 - (parse_time(time_bonus, with_seconds=with_seconds) or timedelta()),
                 time=parse_time(result_time, with_seconds=with_seconds),
@@ -874,20 +888,11 @@ class CSVReader:
         return start
 
     def read_result_status(self, status: str) -> model.ResultStatus:
-        if int(status) == 0:
-            return model.ResultStatus.OK
-        if int(status) == 1:
-            return model.ResultStatus.DID_NOT_START
-        if int(status) == 2:
-            return model.ResultStatus.DID_NOT_FINISH
-        if int(status) == 3:
-            return model.ResultStatus.MISSING_PUNCH
-        if int(status) == 4:
-            return model.ResultStatus.DISQUALIFIED
-        if int(status) == 5:
-            return model.ResultStatus.OVER_TIME
-        msg = f"SportSoftware Wertung={status}"
-        raise NotImplementedError(msg)
+        try:
+            return _result_status_by_code[int(status)]
+        except KeyError as error:
+            msg = f"SportSoftware Wertung={status}"
+            raise NotImplementedError(msg) from error
 
 
 class CSVWriter:
@@ -23,9 +23,6 @@ from datetime import timedelta
 
 from more_itertools import peekable
 
-# Cf. https://github.com/google/or-tools/issues/3993
-from ortools.sat.python import cp_model  # type: ignore [import-untyped]
-
 from .affine_seq import AffineSeq
 from .model import Category, Course, Race, Start, StartTimeAllocationRequestType
 from .tools import disjoin
@@ -177,6 +174,10 @@ def generate_slots_optimal(constraints: StartConstraints, timeout: int = 30) ->
     :return: Start slots object for each course id
     """
 
+    # Imported lazily because loading ortools is slow and only this solver needs it.
+    # Cf. https://github.com/google/or-tools/issues/3993
+    from ortools.sat.python import cp_model  # type: ignore [import-untyped]
+
     interval_min = constraints.interval
     interval_max = 12
     interval_common_factor = 1
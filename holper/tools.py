@@ -1,4 +1,5 @@
 """Miscellaneous helper functions"""
+import functools
 import re
 from collections.abc import Callable
 from datetime import date
@@ -8,6 +9,9 @@ import sqlalchemy
 
 
 # Taken from http://stackoverflow.com/a/1176023
+# The inputs are class and attribute names, so the cache stays tiny while
+# sparing the regex passes on repeated conversions.
+@functools.lru_cache(maxsize=256)
 def camelcase_to_snakecase(name_camel: str) -> str:
     """Convert CamelCase to snake_case syntax"""
     name_tmp = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name_camel)
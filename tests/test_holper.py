@@ -23,3 +23,71 @@ class TestModel:
         event1a = session.merge(model.Event(event_id=1, name="event1a"))
 
         assert event1 is event1a
+
+    def test_bulk_insert(self, session):
+        model.Event.bulk_insert(
+            session,
+            ({"event_id": idx, "name": f"event{idx}"} for idx in range(1, 6)),
+            batch_size=2,
+        )
+
+        assert core.get_event(session, 3).name == "event3"
+
+    def test_get_event_eager_loads(self, session):
+        event = model.Event(event_id=1, name="event1")
+        event.races.append(model.Race())
+        session.add(event)
+        session.flush()
+        session.expire_all()
+
+        loaded = core.get_event(session, 1)
+        # A detached instance raises on any lazy load, so this guards
+        # against regressions of the selectinload options in get_event.
+        session.expunge(loaded)
+
+        assert len(loaded.races) == 1
+        assert loaded.event_categories == []
+        assert loaded.entries == []
+
+    def test_get_event_query_count(self, session):
+        event = model.Event(event_id=1, name="event1")
+        event.races.append(model.Race())
+        session.add(event)
+        session.flush()
+        session.expire_all()
+
+        with model.count_queries(session) as statements:
+            core.get_event(session, 1)
+
+        # One query for the event plus one selectin load per collection.
+        assert len(statements) == 4
+
+    def test_course_control_self_join_eager_load(self, session):
+        event = model.Event(event_id=1, name="event1")
+        race = model.Race(event=event)
+        course = model.Course(race=race, name="A")
+        first = model.CourseControl(course=course, control=model.Control(race=race, label="31"), order=0)
+        second = model.CourseControl(course=course, control=model.Control(race=race, label="32"), order=1, after=first)
+        session.add_all([first, second])
+        session.flush()
+        session.expire_all()
+
+        loaded = session.get(model.CourseControl, second.course_control_id)
+
+        # join_depth=1 folds the self-referential links into the original
+        # load, so following them must not emit further statements.
+        with model.count_queries(session) as statements:
+            assert loaded.after.control.label == "31"
+        assert statements == []
+
+    def test_topological_order(self):
+        order = model.topological_order()
+
+        assert order.index(model.Event) < order.index(model.Race)
+        assert order.index(model.Entry) < order.index(model.Competitor)
+        assert order.index(model.Competitor) < order.index(model.CompetitorStart)
+
+    def test_copy_from_falls_back_on_sqlite(self, session):
+        model.Event.copy_from(session, [{"event_id": 1, "name": "event1"}])
+
+        assert core.get_event(session, 1).name == "event1"